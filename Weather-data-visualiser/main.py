@@ -1,36 +1,112 @@
 
 
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg') # Non-interactive backend: plots are only saved to PNG, never shown
 import matplotlib.pyplot as plt
-import os
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from numba import njit
+from tabulate import tabulate
 
 DATA_FILE = 'your_weather_data.csv' 
 CLEANED_DATA_FILE = 'cleaned_weather_data.csv'
+CLEANED_CACHE_FILE = 'cleaned_weather_data.parquet'
+CACHE_KEY_FIELD = b'weather_visualiser_columns' # Parquet metadata entry recording the cached column config
 REPORT_FILE = 'summary_report.md'
 PLOT_DIR = 'plots'
+PLOT_STYLE = 'ggplot'
+DATE_COLUMN = 'DateColumnName' # <-- CHANGE THIS
+LINE_PLOT_POINTS = 2000 # Line charts are decimated to about this many points
+HEXBIN_MIN_POINTS = 20_000 # Above this many rows the scatter plot becomes a hexbin
+PARALLEL_PLOT_MIN_ROWS = 500_000 # Below this, starting worker processes costs more than it saves
+STREAM_CHUNK_ROWS = 500_000 # Rows per chunk when WDV_STREAMING is set
+STREAM_SAMPLE_SIZE = 50_000 # Rows kept in the random sample that is plotted when streaming
+NUMERIC_COLUMNS = ['Temperature', 'Rainfall', 'Humidity'] # <-- CHANGE THESE
+CATEGORY_COLUMNS = [] # <-- Optional text columns with repeated values, e.g. ['Station']
+RELEVANT_COLUMNS = NUMERIC_COLUMNS + CATEGORY_COLUMNS
+RELEVANT_COLUMN_SET = frozenset(RELEVANT_COLUMNS)
+COLUMN_DTYPES = {
+    **{col: 'float32' for col in NUMERIC_COLUMNS},
+    **{col: 'category' for col in CATEGORY_COLUMNS}, # Repeated strings are stored once per category
+}
 
 if not os.path.exists(PLOT_DIR):
     os.makedirs(PLOT_DIR)
 
-def load_data(file_path):
-    """Loads the CSV file into a Pandas DataFrame."""
+def load_data(file_path, verbose=False):
+    """Loads the CSV file into a Pandas DataFrame; verbose also prints head, info and describe."""
     print(f"Loading data from {file_path}...")
     try:
-        df = pd.read_csv(file_path)
+        # Only columns that are actually present are requested, so a missing one is reported
+        # by clean_data instead of failing the whole read
+        header = pd.read_csv(file_path, nrows=0).columns
+        wanted = header.intersection([DATE_COLUMN] + RELEVANT_COLUMNS)
+
+        # The pyarrow engine parses the file in parallel; only the needed columns are read,
+        # with fixed dtypes so no type inference pass is needed
+        df = pd.read_csv(
+            file_path,
+            engine='pyarrow',
+            usecols=list(wanted),
+            dtype={col: dtype for col, dtype in COLUMN_DTYPES.items() if col in wanted},
+            parse_dates=[DATE_COLUMN] if DATE_COLUMN in wanted else None,
+        )
         print("Data loaded successfully.")
         
-        print("\n--- Data Structure (Head) ---")
-        print(df.head())
-        print("\n--- Data Information (Info) ---")
-        df.info()
-        print("\n--- Data Statistics (Describe) ---")
-        print(df.describe())
+        if verbose:
+            print("\n--- Data Structure (Head) ---")
+            print(df.head())
+            print("\n--- Data Information (Info) ---")
+            df.info()
+            print("\n--- Data Statistics (Describe) ---")
+            print(df.describe())
         
         return df
     except FileNotFoundError:
         print(f"Error: File not found at {file_path}. Please download the weather data.")
         return None
+    except ValueError as e:
+        print(f"Error reading {file_path}: {e}. Check the column names in DATE_COLUMN and RELEVANT_COLUMNS.")
+        return None
+
+def cache_key():
+    """Identifies the column configuration the cleaned data was produced with."""
+    return ','.join([DATE_COLUMN] + RELEVANT_COLUMNS).encode()
+
+def load_cached_data(cache_path, source_path):
+    """Loads previously cleaned data from Parquet if it is still valid.
+
+    The cache must be newer than both the source CSV and this script, and must have been
+    written with the current DATE_COLUMN and RELEVANT_COLUMNS.
+    """
+    if not (os.path.exists(cache_path) and os.path.exists(source_path)):
+        return None
+    cache_time = os.path.getmtime(cache_path)
+    if cache_time <= os.path.getmtime(source_path) or cache_time <= os.path.getmtime(__file__):
+        return None
+    metadata = pq.read_schema(cache_path).metadata or {}
+    if metadata.get(CACHE_KEY_FIELD) != cache_key():
+        print(f"Ignoring {cache_path}: it was built with a different column configuration.")
+        return None
+    print(f"Loading cached cleaned data from {cache_path}...")
+    return pd.read_parquet(cache_path)
+
+def compact_column(series):
+    """Returns a column's values as float32, or as a Categorical for strings."""
+    if pd.api.types.is_numeric_dtype(series):
+        # Sensor readings need no more than float32; this halves memory traffic in every later pass
+        return np.ascontiguousarray(series.to_numpy(dtype=np.float32))
+    if isinstance(series.dtype, pd.CategoricalDtype): # Already read as 'category' via COLUMN_DTYPES
+        return series.array
+    return pd.Categorical(series.to_numpy())
 
 def clean_data(df):
     """Handles missing values, converts date formats, and filters columns."""
@@ -40,11 +116,9 @@ def clean_data(df):
     
     print(f"Rows dropped/filled: {initial_rows - len(df)} rows.")
 
-    DATE_COLUMN = 'DateColumnName' # <-- CHANGE THIS
     try:
-        df[DATE_COLUMN] = pd.to_datetime(df[DATE_COLUMN])
         df.set_index(DATE_COLUMN, inplace=True)
-        print("Date column converted to datetime and set as index.")
+        print("Date column set as index.")
     except KeyError:
         print(f"Warning: Date column '{DATE_COLUMN}' not found or incorrectly named.")
         return None
@@ -52,116 +126,403 @@ def clean_data(df):
         print(f"Error converting date column: {e}")
         return None
     
-    RELEVANT_COLUMNS = ['Temperature', 'Rainfall', 'Humidity'] # <-- CHANGE THESE
-    
-    missing_cols = [col for col in RELEVANT_COLUMNS if col not in df.columns]
+    missing_cols = RELEVANT_COLUMN_SET.difference(df.columns)
     if missing_cols:
-        print(f"Warning: Missing relevant columns: {missing_cols}. Please check your column names.")
-        existing_cols = [col for col in RELEVANT_COLUMNS if col in df.columns]
-        df_cleaned = df[existing_cols].copy()
-    else:
-        df_cleaned = df[RELEVANT_COLUMNS].copy()
+        print(f"Warning: Missing relevant columns: {sorted(missing_cols)}. Please check your column names.")
+    existing_cols = df.columns.intersection(RELEVANT_COLUMNS)
+
+    # Build the frame column by column so every column owns a contiguous 1D buffer
+    df_cleaned = pd.DataFrame(
+        {col: compact_column(df[col]) for col in existing_cols},
+        index=df.index,
+    )
         
     print("Data cleaning complete.")
     return df_cleaned
 
+@njit(cache=True)
+def column_moments(a):
+    """Accumulates count, sum, sum of squares, min and max of each column in one pass, skipping NaNs."""
+    n, k = a.shape
+    out = np.empty((5, k))
+    for j in range(k):
+        count = 0
+        s = 0.0
+        ss = 0.0
+        mn = np.nan
+        mx = np.nan
+        for i in range(n):
+            v = np.float64(a[i, j])
+            if np.isnan(v):
+                continue
+            if count == 0 or v < mn:
+                mn = v
+            if count == 0 or v > mx:
+                mx = v
+            count += 1
+            s += v
+            ss += v * v
+        out[0, j] = count
+        out[1, j] = s
+        out[2, j] = ss
+        out[3, j] = mn
+        out[4, j] = mx
+    return out
+
+def merge_column_moments(first, second):
+    """Combines the column_moments of two chunks into the moments of both together."""
+    return np.vstack([
+        first[:3] + second[:3],
+        np.fmin(first[3], second[3]),
+        np.fmax(first[4], second[4]),
+    ])
+
+def statistics_frame(moments, columns):
+    """Turns column_moments into the Mean/Min/Max/StdDev summary table (sample std, ddof=1)."""
+    count, total, squares, minimum, maximum = moments
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(count > 0, total / count, np.nan)
+        variance = np.where(count > 1, np.maximum(squares - count * mean * mean, 0.0) / (count - 1), np.nan)
+    return pd.DataFrame(
+        [mean, minimum, maximum, np.sqrt(variance)],
+        index=['Mean', 'Min', 'Max', 'StdDev'],
+        columns=columns,
+    )
+
 def compute_statistics(df):
     """Computes overall statistics using NumPy and Pandas for summary."""
     print("\n--- Starting Statistical Analysis ---")
     
-    overall_stats = df.agg({
-        'Temperature': [np.mean, np.min, np.max, np.std],
-        'Rainfall': [np.mean, np.min, np.max, np.std],
-        'Humidity': [np.mean, np.min, np.max, np.std]
-    }).rename(columns={'mean': 'Mean', 'amin': 'Min', 'amax': 'Max', 'std': 'StdDev'})
+    values = df[NUMERIC_COLUMNS].to_numpy(dtype=np.float32)
+
+    # All four statistics come from one fused pass over the data
+    overall_stats = statistics_frame(column_moments(values), NUMERIC_COLUMNS)
     
     print("\nOverall Summary Statistics (NumPy/Pandas):")
     print(overall_stats)
     
     return overall_stats
 
+@njit(cache=True)
+def monthly_moments(a, bins, nbins):
+    """Bins rows by month in one pass over a (Temperature, Rainfall, Humidity) array.
+
+    Returns one row of running totals per month: Temperature count/sum/min/max,
+    Rainfall sum, and Humidity count/sum.
+    """
+    out = np.zeros((nbins, 7))
+    out[:, 2] = np.nan
+    out[:, 3] = np.nan
+    for i in range(a.shape[0]):
+        b = bins[i]
+        t = np.float64(a[i, 0])
+        if not np.isnan(t):
+            if out[b, 0] == 0 or t < out[b, 2]:
+                out[b, 2] = t
+            if out[b, 0] == 0 or t > out[b, 3]:
+                out[b, 3] = t
+            out[b, 0] += 1
+            out[b, 1] += t
+        r = np.float64(a[i, 1])
+        if not np.isnan(r):
+            out[b, 4] += r
+        h = np.float64(a[i, 2])
+        if not np.isnan(h):
+            out[b, 5] += 1
+            out[b, 6] += h
+    return out
+
+def merge_monthly_moments(first, first_base, second, second_base):
+    """Combines two monthly_moments arrays that may cover different month ranges."""
+    base = min(first_base, second_base)
+    nbins = max(first_base + len(first), second_base + len(second)) - base
+    merged = np.zeros((nbins, 7))
+    merged[:, 2:4] = np.nan
+    for moments, offset in ((first, first_base - base), (second, second_base - base)):
+        rows = merged[offset:offset + len(moments)]
+        rows[:, [0, 1, 4, 5, 6]] += moments[:, [0, 1, 4, 5, 6]]
+        rows[:, 2] = np.fmin(rows[:, 2], moments[:, 2])
+        rows[:, 3] = np.fmax(rows[:, 3], moments[:, 3])
+    return merged, base
+
+def month_bins(index):
+    """Maps a DatetimeIndex to month numbers counted from its first month."""
+    months = index.year.to_numpy() * 12 + index.month.to_numpy() - 1
+    if len(months) == 0:
+        return months.astype(np.int64), 0, 0
+    base = months.min()
+    return (months - base).astype(np.int64), int(base), int(months.max() - base + 1)
+
+def month_ends(base, nbins):
+    """Returns the last day of each of nbins consecutive months starting at month number base."""
+    next_months = (np.arange(nbins) + base - 1970 * 12 + 1).astype('datetime64[M]')
+    return (next_months.astype('datetime64[D]') - np.timedelta64(1, 'D')).astype('datetime64[ns]')
+
+def monthly_summary_frame(moments, base, index_name):
+    """Turns monthly_moments into the same layout as df.resample('M').agg(...)."""
+    t_count, t_sum, t_min, t_max, r_sum, h_count, h_sum = moments.T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_mean = np.where(t_count > 0, t_sum / t_count, np.nan)
+        h_mean = np.where(h_count > 0, h_sum / h_count, np.nan)
+    return pd.DataFrame(
+        np.column_stack([t_mean, t_min, t_max, r_sum, h_mean]),
+        index=pd.DatetimeIndex(month_ends(base, len(moments)), name=index_name),
+        columns=pd.MultiIndex.from_tuples([
+            ('Temperature', 'mean'),
+            ('Temperature', 'min'),
+            ('Temperature', 'max'),
+            ('Rainfall', 'sum'),  # Total rainfall
+            ('Humidity', 'mean'),
+        ]),
+    )
+
 def group_and_aggregate(df):
     """Groups data by month and computes aggregate statistics (mean, total)."""
     print("\n--- Starting Grouping and Aggregation ---")
     
-    monthly_summary = df.resample('M').agg({
-        'Temperature': ['mean', 'min', 'max'],
-        'Rainfall': 'sum',  # Total rainfall
-        'Humidity': 'mean'
-    })
-    
+    if df.index.hasnans:
+        df = df[df.index.notna()]
+
+    bins, base, nbins = month_bins(df.index)
+    values = df[NUMERIC_COLUMNS].to_numpy(dtype=np.float32) # Column order must match monthly_moments
+
+    monthly_summary = monthly_summary_frame(monthly_moments(values, bins, nbins), base, df.index.name)
     
     print("\nMonthly Aggregate Statistics (Pandas Groupby/Resample):")
     print(monthly_summary.head())
     
     return monthly_summary
 
-def create_visualizations(df_cleaned, monthly_summary):
+def stream_data(file_path, chunk_rows=STREAM_CHUNK_ROWS, sample_size=STREAM_SAMPLE_SIZE):
+    """Reads the CSV chunk by chunk, returning overall stats, the monthly summary and a random row sample.
+
+    Only one chunk and the sample are held in memory, so the file can be larger than RAM.
+    """
+    print(f"Streaming data from {file_path} in chunks of {chunk_rows} rows...")
+    rng = np.random.default_rng()
+    stats_moments = None
+    month_moments, month_base = np.zeros((0, 7)), 0
+    sample, sample_keys = None, np.empty(0)
+    rows = 0
+    try:
+        reader = pd.read_csv(
+            file_path,
+            chunksize=chunk_rows,
+            usecols=[DATE_COLUMN] + RELEVANT_COLUMNS,
+            dtype=COLUMN_DTYPES,
+            parse_dates=[DATE_COLUMN],
+            index_col=DATE_COLUMN,
+        )
+        for chunk in reader:
+            rows += len(chunk)
+            values = chunk[NUMERIC_COLUMNS].to_numpy(dtype=np.float32)
+            moments = column_moments(values)
+            stats_moments = moments if stats_moments is None else merge_column_moments(stats_moments, moments)
+
+            dated = chunk.index.notna()
+            bins, base, nbins = month_bins(chunk.index[dated])
+            if nbins:
+                monthly = monthly_moments(values[dated], bins, nbins)
+                if len(month_moments):
+                    month_moments, month_base = merge_monthly_moments(month_moments, month_base, monthly, base)
+                else:
+                    month_moments, month_base = monthly, base
+
+            # Reservoir sample: every row gets a random key and the sample_size smallest keys are kept
+            keys = np.concatenate([sample_keys, rng.random(len(chunk))])
+            candidates = chunk if sample is None else pd.concat([sample, chunk])
+            if len(keys) > sample_size:
+                keep = np.argpartition(keys, sample_size)[:sample_size]
+                candidates, keys = candidates.iloc[keep], keys[keep]
+            sample, sample_keys = candidates, keys
+    except FileNotFoundError:
+        print(f"Error: File not found at {file_path}. Please download the weather data.")
+        return None
+    except ValueError as e:
+        print(f"Error reading {file_path}: {e}. Check the column names in DATE_COLUMN and RELEVANT_COLUMNS.")
+        return None
+
+    if stats_moments is None:
+        print(f"Error: {file_path} contains no data rows.")
+        return None
+
+    overall_stats = statistics_frame(stats_moments, NUMERIC_COLUMNS)
+    monthly_summary = monthly_summary_frame(month_moments, month_base, DATE_COLUMN)
+    df_sample = pd.DataFrame(
+        {col: compact_column(sample[col]) for col in RELEVANT_COLUMNS},
+        index=sample.index,
+    ).sort_index()
+
+    print(f"Streamed {rows} rows; plotting a random sample of {len(df_sample)}.")
+    print("\nOverall Summary Statistics (NumPy/Pandas):")
+    print(overall_stats)
+    print("\nMonthly Aggregate Statistics (Pandas Groupby/Resample):")
+    print(monthly_summary.head())
+
+    return overall_stats, monthly_summary, df_sample
+
+def monthly_rainfall_totals(df):
+    """Sums rainfall per month with a single np.bincount pass; returns a month-end indexed Series."""
+    if df.index.hasnans:
+        df = df[df.index.notna()]
+
+    bins, base, nbins = month_bins(df.index)
+    rainfall = df['Rainfall'].to_numpy(dtype=np.float64)
+    valid = ~np.isnan(rainfall) # NaNs are skipped, like resample().sum()
+    totals = np.bincount(bins[valid], weights=rainfall[valid], minlength=nbins)
+    return pd.Series(totals, index=pd.DatetimeIndex(month_ends(base, nbins), name=df.index.name), name='Rainfall')
+
+def plot_temperature(dates, temperature):
+    """Saves the daily temperature line chart."""
+    with plt.style.context(PLOT_STYLE):
+        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.plot(dates, temperature, label='Daily Temperature', color='tab:red', rasterized=True)
+        ax.set_title('Daily Temperature Trend')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Temperature (°C)')
+        ax.legend()
+        ax.grid(True)
+        fig.savefig(os.path.join(PLOT_DIR, 'temperature_line_chart.png'))
+        plt.close(fig)
+    return 'temperature_line_chart.png'
+
+def plot_rainfall(month_labels, rainfall):
+    """Saves the monthly rainfall bar chart."""
+    with plt.style.context(PLOT_STYLE):
+        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.bar(month_labels, rainfall, color='tab:blue')
+        ax.set_title('Monthly Rainfall Totals')
+        ax.set_xlabel('Month')
+        ax.set_ylabel('Total Rainfall (mm)')
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        ax.grid(axis='y')
+        fig.tight_layout()
+        fig.savefig(os.path.join(PLOT_DIR, 'rainfall_bar_chart.png'))
+        plt.close(fig)
+    return 'rainfall_bar_chart.png'
+
+def plot_scatter(temperature, humidity):
+    """Saves the humidity vs. temperature scatter plot (a hexbin for large inputs)."""
+    with plt.style.context(PLOT_STYLE):
+        fig, ax = plt.subplots(figsize=(8, 6))
+        if len(temperature) > HEXBIN_MIN_POINTS:
+            valid = np.isfinite(temperature) & np.isfinite(humidity)
+            ax.hexbin(temperature[valid], humidity[valid], gridsize=60, cmap='Greens', mincnt=1)
+        else:
+            # Line2D markers draw much faster than a per-point scatter PathCollection
+            ax.plot(temperature, humidity, 'o', markersize=2, alpha=0.6, color='tab:green', rasterized=True)
+        ax.set_title('Humidity vs. Temperature')
+        ax.set_xlabel('Temperature (°C)')
+        ax.set_ylabel('Humidity (%)')
+        ax.grid(True)
+        fig.savefig(os.path.join(PLOT_DIR, 'humidity_temp_scatter_plot.png'))
+        plt.close(fig)
+    return 'humidity_temp_scatter_plot.png'
+
+def plot_combined(dates, temperature, humidity):
+    """Saves the combined temperature/humidity subplots (Advanced Plotting Bonus)."""
+    with plt.style.context(PLOT_STYLE):
+        fig, axes = plt.subplots(2, 1, figsize=(12, 10), sharex=True)
+
+        axes[0].plot(dates, temperature, color='tab:red', label='Temperature', rasterized=True)
+        axes[0].set_title('Daily Temperature and Humidity Trends')
+        axes[0].set_ylabel('Temperature (°C)')
+        axes[0].legend(loc='upper left')
+
+        # Plot 2: Humidity
+        axes[1].plot(dates, humidity, color='tab:purple', label='Humidity', rasterized=True)
+        axes[1].set_xlabel('Date')
+        axes[1].set_ylabel('Humidity (%)')
+        axes[1].legend(loc='upper left')
+
+        fig.tight_layout()
+        fig.savefig(os.path.join(PLOT_DIR, 'combined_temp_humidity_subplots.png'))
+        plt.close(fig)
+    return 'combined_temp_humidity_subplots.png'
+
+def create_visualizations(df_cleaned, monthly_rainfall):
     """Creates required plots using Matplotlib and saves them as PNG files."""
     print("\n--- Creating Visualizations ---")
-    
-    plt.style.use('ggplot')
-
-    plt.figure(figsize=(12, 6))
-    plt.plot(df_cleaned.index, df_cleaned['Temperature'], label='Daily Temperature', color='tab:red')
-    plt.title('Daily Temperature Trend')
-    plt.xlabel('Date')
-    plt.ylabel('Temperature (°C)')
-    plt.legend()
-    plt.grid(True)
-    plt.savefig(os.path.join(PLOT_DIR, 'temperature_line_chart.png'))
-    plt.close()
-    print("Saved: temperature_line_chart.png")
-    
-    monthly_rainfall = monthly_summary['Rainfall']['sum']
-    monthly_rainfall.index = monthly_rainfall.index.strftime('%Y-%m') 
-    
-    plt.figure(figsize=(12, 6))
-    plt.bar(monthly_rainfall.index, monthly_rainfall.values, color='tab:blue')
-    plt.title('Monthly Rainfall Totals')
-    plt.xlabel('Month')
-    plt.ylabel('Total Rainfall (mm)')
-    plt.xticks(rotation=45, ha='right')
-    plt.grid(axis='y')
-    plt.tight_layout()
-    plt.savefig(os.path.join(PLOT_DIR, 'rainfall_bar_chart.png'))
-    plt.close()
-    print("Saved: rainfall_bar_chart.png")
-
-    plt.figure(figsize=(8, 6))
-    plt.scatter(df_cleaned['Temperature'], df_cleaned['Humidity'], alpha=0.6, color='tab:green')
-    plt.title('Humidity vs. Temperature')
-    plt.xlabel('Temperature (°C)')
-    plt.ylabel('Humidity (%)')
-    plt.grid(True)
-    plt.savefig(os.path.join(PLOT_DIR, 'humidity_temp_scatter_plot.png'))
-    plt.close()
-    print("Saved: humidity_temp_scatter_plot.png")
-    
-    fig, axes = plt.subplots(2, 1, figsize=(12, 10), sharex=True) # Combined plot (Advanced Plotting Bonus) 
-
-    axes[0].plot(df_cleaned.index, df_cleaned['Temperature'], color='tab:red', label='Temperature')
-    axes[0].set_title('Daily Temperature and Humidity Trends')
-    axes[0].set_ylabel('Temperature (°C)')
-    axes[0].legend(loc='upper left')
-
-    # Plot 2: Humidity
-    axes[1].plot(df_cleaned.index, df_cleaned['Humidity'], color='tab:purple', label='Humidity')
-    axes[1].set_xlabel('Date')
-    axes[1].set_ylabel('Humidity (%)')
-    axes[1].legend(loc='upper left')
-    
-    plt.tight_layout()
-    plt.savefig(os.path.join(PLOT_DIR, 'combined_temp_humidity_subplots.png'))
-    plt.close()
-    print("Saved: combined_temp_humidity_subplots.png")
 
-def export_results(df_cleaned, overall_stats, monthly_summary):
-    """Exports cleaned data and generates the summary report."""
+    # Pull the NumPy arrays out of pandas once; every chart below reuses them
+    temperature = df_cleaned['Temperature'].to_numpy()
+    humidity = df_cleaned['Humidity'].to_numpy()
+    dates = df_cleaned.index.values
+
+    # Decimate long series by stride slicing: Agg draw cost grows with the number of segments
+    if len(df_cleaned) > 2 * LINE_PLOT_POINTS:
+        step = len(df_cleaned) // LINE_PLOT_POINTS
+        line_dates, line_temperature, line_humidity = dates[::step], temperature[::step], humidity[::step]
+    else:
+        line_dates, line_temperature, line_humidity = dates, temperature, humidity
+
+    # 'YYYY-MM' labels formatted in one vectorized call instead of per-element strftime
+    month_labels = np.datetime_as_string(monthly_rainfall.index.values.astype('datetime64[M]'))
+
+    # The plot functions take plain NumPy arrays, which are cheap to pickle to worker processes
+    plot_jobs = [
+        (plot_temperature, line_dates, line_temperature),
+        (plot_rainfall, month_labels, monthly_rainfall.to_numpy()),
+        (plot_scatter, temperature, humidity),
+        (plot_combined, line_dates, line_temperature, line_humidity),
+    ]
+
+    if len(df_cleaned) < PARALLEL_PLOT_MIN_ROWS:
+        for plot, *args in plot_jobs:
+            print(f"Saved: {plot(*args)}")
+        return
+
+    # The four charts are independent, so large inputs render them in parallel processes.
+    # 'spawn' avoids forking a process that already runs Numba/BLAS threads.
+    with ProcessPoolExecutor(max_workers=len(plot_jobs), mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = [executor.submit(plot, *args) for plot, *args in plot_jobs]
+        for future in futures:
+            print(f"Saved: {future.result()}")
+
+def markdown_table(frame, row_labels):
+    """Formats a DataFrame as a pipe Markdown table straight from its values, with two-decimal floats."""
+    headers = [' '.join(col) if isinstance(col, tuple) else col for col in frame.columns]
+    return tabulate(frame.to_numpy(), headers=headers, showindex=list(row_labels),
+                    tablefmt='pipe', floatfmt='.2f')
+
+def write_cleaned_csv(table, index, file_path):
+    """Writes an Arrow table of cleaned data in the same layout DataFrame.to_csv produced.
+
+    The date index goes first, the header is unquoted, and dates are written as
+    'YYYY-MM-DD' (or 'YYYY-MM-DD HH:MM:SS' when times are present).
+    """
+    names = table.column_names
+    dates = table.column(len(names) - 1) # from_pandas appends the index last
+    stamps = index.values[~np.isnat(index.values)]
+    if (stamps.astype('datetime64[D]') == stamps).all():
+        dates = pc.cast(dates, pa.date32())
+    elif (stamps.astype('datetime64[s]') == stamps).all():
+        dates = pc.cast(dates, pa.timestamp('s')) # Second resolution prints without a fraction
+
+    ordered = pa.table(
+        [dates] + [table.column(i) for i in range(len(names) - 1)],
+        names=[names[-1]] + names[:-1],
+    )
+    with open(file_path, 'wb') as f:
+        f.write((','.join(ordered.column_names) + '\n').encode())
+        pacsv.write_csv(ordered, f, pacsv.WriteOptions(include_header=False, quoting_style='needed'))
+
+def export_results(df_cleaned, overall_stats, monthly_summary, write_data=True):
+    """Exports cleaned data (unless write_data is False) and generates the summary report."""
     print("\n--- Starting Export and Reporting ---")
     
-    df_cleaned.to_csv(CLEANED_DATA_FILE)
-    print(f"Cleaned data exported to {CLEANED_DATA_FILE}")
+    if write_data and df_cleaned is not None: # Streaming runs never hold the full cleaned data
+        # pyarrow's C++ CSV writer is much faster than DataFrame.to_csv's row writer
+        table = pa.Table.from_pandas(df_cleaned, preserve_index=True)
+        write_cleaned_csv(table, df_cleaned.index, CLEANED_DATA_FILE)
+        print(f"Cleaned data exported to {CLEANED_DATA_FILE}")
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), CACHE_KEY_FIELD: cache_key()})
+        pq.write_table(table, CLEANED_CACHE_FILE, compression='zstd')
+        print(f"Cleaned data cached to {CLEANED_CACHE_FILE}")
+
+    overall_table = markdown_table(overall_stats, overall_stats.index)
+    monthly_head = monthly_summary.head()
+    monthly_table = markdown_table(monthly_head, np.datetime_as_string(monthly_head.index.values, unit='D'))
 
     report_content = f"""
 # Weather Data Analysis Report
@@ -178,7 +539,7 @@ This report summarizes the analysis and visualization of local weather data usin
 The following statistics were computed using NumPy and Pandas[cite: 24, 26]:
 
 ### Overall Statistics:
-{overall_stats.to_markdown()}
+{overall_table}
 
 **Interpretation (Example):**
 * **Temperature:** The average temperature was [Mean Temp], with a high variability (StdDev: [StdDev Temp]), suggesting significant seasonal changes.
@@ -187,7 +548,7 @@ The following statistics were computed using NumPy and Pandas[cite: 24, 26]:
 ### Monthly Aggregation Summary
 The data was grouped by month to analyze seasonal trends[cite: 34, 35]. Below is a snippet of the monthly results:
 
-{monthly_summary.head().to_markdown()}
+{monthly_table}
 
 ## 4. Visualization Insights
 All plots are saved as PNG files in the '{PLOT_DIR}' directory[cite: 38].
@@ -210,29 +571,46 @@ The analysis successfully provided insights into the local climate patterns, par
     print(f"Summary report exported to {REPORT_FILE}")
 
 
+def env_flag(name):
+    """Reads an on/off switch from the environment; '1', 'true', 'yes' and 'on' turn it on."""
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
 def main():
     """Main function to run the entire data analysis and visualization pipeline."""
     
-    df_raw = load_data(DATA_FILE)
-    if df_raw is None:
-        print("\nProcess aborted due to data loading failure.")
-        return
+    if env_flag('WDV_STREAMING'):
+        streamed = stream_data(DATA_FILE)
+        if streamed is None:
+            print("\nProcess aborted due to data loading failure.")
+            return
+        overall_stats, monthly_summary, df_sample = streamed
 
-    df_cleaned = clean_data(df_raw)
-    if df_cleaned is None:
-        print("\nProcess aborted due to data cleaning failure.")
-        return
-    
+        create_visualizations(df_sample, monthly_summary['Rainfall']['sum'])
 
-    overall_stats = compute_statistics(df_cleaned)
-    
+        export_results(None, overall_stats, monthly_summary)
+    else:
+        df_cleaned = load_cached_data(CLEANED_CACHE_FILE, DATA_FILE)
+        from_cache = df_cleaned is not None
+        if not from_cache:
+            df_raw = load_data(DATA_FILE, verbose=env_flag('WDV_VERBOSE'))
+            if df_raw is None:
+                print("\nProcess aborted due to data loading failure.")
+                return
 
-    monthly_summary = group_and_aggregate(df_cleaned)
-    
+            df_cleaned = clean_data(df_raw)
+            if df_cleaned is None:
+                print("\nProcess aborted due to data cleaning failure.")
+                return
 
-    create_visualizations(df_cleaned, monthly_summary)
-    
-    export_results(df_cleaned, overall_stats, monthly_summary)
+        overall_stats = compute_statistics(df_cleaned)
+
+        monthly_summary = group_and_aggregate(df_cleaned)
+
+        create_visualizations(df_cleaned, monthly_rainfall_totals(df_cleaned))
+
+        # A cache hit means the exported files are already up to date; rewriting them would
+        # also refresh the cache's mtime on every run
+        export_results(df_cleaned, overall_stats, monthly_summary, write_data=not from_cache)
     
     print("\n--- Project Complete! ---")
     print("Remember to commit all files (script, CSV, plots, report) to your GitHub repository.")